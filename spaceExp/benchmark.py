@@ -0,0 +1,185 @@
+"""
+Stress scenarios for the space-game loop.
+
+Each scenario keeps a fixed load on the game (N aliens on screen, M player
+bullets in flight, a planet spawn rate) and runs both spaceEXP.py and
+spaceEXPvX.py headless for the same number of ticks, rendering every
+tick. It reports ms per tick, canvas (Tk) calls per tick and bytes
+allocated per tick as JSON, so runs from two versions of the code can be
+diffed:
+
+    python benchmark.py --out before.json
+    ... change something ...
+    python benchmark.py --baseline before.json
+
+Allocations are measured with tracemalloc in a separate pass, so its
+overhead does not distort the timings.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+import spaceEXP
+import spaceEXPvX
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    aliens: int = 0             # aliens kept on screen (topped up every tick)
+    bullets: int = 0            # player bullets kept in flight
+    planet_rate: float = 0.008  # chance per tick of a new planet
+    alien_rate: float = 0.0     # the game's own alien spawning on top of `aliens`
+    ticks: int = 600
+    warmup: int = 60
+    seed: int = 1
+
+
+SCENARIOS = {s.name: s for s in (
+    Scenario("idle", planet_rate=0.0),
+    Scenario("default_spawns", alien_rate=0.03),
+    Scenario("aliens_200", aliens=200),
+    Scenario("aliens_1000", aliens=1000, ticks=200),
+    Scenario("bullets_200", aliens=50, bullets=200),
+    Scenario("planet_rain", planet_rate=1.0),
+    Scenario("everything", aliens=500, bullets=200, planet_rate=0.5, ticks=300),
+)}
+
+
+class _GameDriver:
+    """Builds one game version for a scenario and keeps its load topped up."""
+
+    def __init__(self, module, scenario):
+        self.module = module
+        self.scenario = scenario
+        overrides = {"ALIEN_SPAWN_RATE": scenario.alien_rate,
+                     "PLANET_SPAWN_RATE": scenario.planet_rate}
+        if module is spaceEXPvX:
+            overrides["PLAYER_BULLETS"] = max(scenario.bullets, module.SpaceExplorerGame.PLAYER_BULLETS)
+        game_class = type("BenchmarkGame", (module.SpaceExplorerGame,), overrides)
+        self.game = game_class(seed=scenario.seed)
+        self.game.lives = 10**9  # the player must survive the whole run
+        self.rng = self.game.rng
+        self.width = getattr(self.game, "WIDTH", None) or self.game.CANVAS_WIDTH
+        self._top_up(initial=True)
+
+    def _add_alien(self, y):
+        game, x = self.game, self.rng.uniform(0, self.width - 40)
+        if self.module is spaceEXPvX:
+            self.module.Alien(game.alien_store, x, y, game.clock, self.rng)
+        else:
+            game.alien_group.add(self.module.Alien(game.canvas, x, y, game.clock, self.rng))
+
+    def _add_bullet(self, y):
+        game, x = self.game, self.rng.uniform(0, self.width)
+        if self.module is spaceEXPvX:
+            game.bullet_pool.acquire(x, y, 0, -12)
+        else:
+            game.bullet_group.add(self.module.Bullet(game.canvas, x, y, -10))
+
+    def _top_up(self, initial=False):
+        game = self.game
+        for _ in range(self.scenario.aliens - len(game.aliens)):
+            self._add_alien(self.rng.uniform(-40, 500) if initial else -40)
+        for _ in range(self.scenario.bullets - len(game.bullets)):
+            self._add_bullet(self.rng.uniform(0, 590) if initial else 590)
+
+    def tick(self):
+        self._top_up()
+        self.game.tick(render=True)
+
+
+def run_scenario(scenario, module):
+    """Run one scenario against one game version; returns its result dict."""
+    driver = _GameDriver(module, scenario)
+    game = driver.game
+    for _ in range(scenario.warmup):
+        driver.tick()
+    game.canvas.take()
+
+    times, entities = [], 0
+    for _ in range(scenario.ticks):
+        start = time.perf_counter()
+        driver.tick()
+        times.append((time.perf_counter() - start) * 1000)
+        entities += game.entity_count()
+    tk_calls = game.canvas.take()
+
+    tracemalloc.start()
+    allocated = 0
+    for _ in range(min(scenario.ticks, 100)):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        driver.tick()
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    alloc_ticks = min(scenario.ticks, 100)
+
+    times.sort()
+    return {
+        "scenario": scenario.name,
+        "game": module.__name__,
+        "ticks": scenario.ticks,
+        "ms_per_tick": round(statistics.fmean(times), 4),
+        "p95_ms": round(times[int(len(times) * 0.95) - 1], 4),
+        "tk_calls_per_tick": round(tk_calls / scenario.ticks, 2),
+        "alloc_bytes_per_tick": round(allocated / alloc_ticks),
+        "mean_entities": round(entities / scenario.ticks, 1),
+    }
+
+
+def run_suite(names=None, ticks=None):
+    results, scenarios = [], {}
+    for name in names or SCENARIOS:
+        scenario = SCENARIOS[name]
+        if ticks:
+            scenario = Scenario(**{**asdict(scenario), "ticks": ticks})
+        scenarios[name] = asdict(scenario)  # as run, including any --ticks override
+        for module in (spaceEXP, spaceEXPvX):
+            results.append(run_scenario(scenario, module))
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "scenarios": scenarios, "results": results}
+
+
+def compare(baseline, current):
+    """Rows of (scenario, game, baseline ms, current ms, ratio) for results present in both."""
+    old = {(r["scenario"], r["game"]): r for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        before = old.get((r["scenario"], r["game"]))
+        if before:
+            rows.append((r["scenario"], r["game"], before["ms_per_tick"], r["ms_per_tick"],
+                         round(r["ms_per_tick"] / before["ms_per_tick"], 2) if before["ms_per_tick"] else None))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="run only this scenario (repeatable)")
+    parser.add_argument("--ticks", type=int, help="override the ticks of every scenario")
+    parser.add_argument("--out", help="write the JSON results to this file")
+    parser.add_argument("--baseline", help="earlier JSON results to compare ms/tick against")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.scenario, args.ticks)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for scenario, game, before, after, ratio in compare(baseline, report):
+            print(f"{scenario:16} {game:11} {before:8.3f} -> {after:8.3f} ms/tick  x{ratio}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
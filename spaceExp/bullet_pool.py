@@ -0,0 +1,57 @@
+"""
+Fixed-size bullet pool for spaceEXPvX.
+
+All bullets and their canvas ovals are created up front. Firing takes a
+free bullet, puts it back in its EntityStore and shows it at the muzzle.
+Leaving the screen or hitting something hides it and returns it to the
+free list. Tk item ids and Python objects are therefore reused instead of
+being created and deleted on every shot.
+"""
+
+
+class BulletPool:
+    """
+    `factory(store)` builds one bullet in `store`; the pool builds `size` of
+    them, hides them and takes them out of the store until acquired.
+    acquire() returns None when every bullet is in flight; that is counted
+    in `exhausted`, and `high_water` records the most bullets in use at once.
+    """
+
+    def __init__(self, store, size, factory):
+        self.store = store
+        self.size = size
+        self._free = []
+        self.in_use = 0
+        self.high_water = 0
+        self.exhausted = 0
+        for _ in range(size):
+            bullet = factory(store)
+            store.remove(bullet)
+            store.canvas.itemconfig(bullet._id, state="hidden")
+            self._free.append(bullet)
+
+    def acquire(self, x, y, vx, vy):
+        if not self._free:
+            self.exhausted += 1
+            return None
+        bullet = self._free.pop()
+        bullet._dead = False
+        bullet._slot = self.store.add(bullet, x, y, vx, vy, bullet._size)
+        canvas = self.store.canvas
+        canvas.coords(bullet._id, x, y, x + bullet._size, y + bullet._size)
+        canvas.itemconfig(bullet._id, state="normal")
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return bullet
+
+    def release(self, bullet):
+        """Hide a live bullet and return it to the free list (EntityManager.flush calls this)."""
+        self.store.remove(bullet)
+        self.store.canvas.itemconfig(bullet._id, state="hidden")
+        self._free.append(bullet)
+        self.in_use -= 1
+
+    def stats(self):
+        return {"size": self.size, "in_use": self.in_use,
+                "high_water": self.high_water, "exhausted": self.exhausted}
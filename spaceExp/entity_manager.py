@@ -0,0 +1,127 @@
+"""
+Central entity lifecycle for both space games.
+
+Game rules never delete canvas items or remove objects from their lists
+directly any more: they kill() the object, and the EntityManager destroys
+everything killed during a phase in one flush(). Canvas items are deleted
+with a single canvas.delete call, rows are swap-removed and pooled bullets
+go back to their pool. audit() compares the entity items on the canvas with
+what the live entities account for, so a leak shows up as a non-zero
+leaked_items count instead of a slowly growing canvas.
+"""
+
+
+class EntityList:
+    """
+    Dense list of game objects with O(1) swap-remove: the plain-object
+    counterpart of EntityStore, used by spaceEXP.py. Order is not kept.
+    """
+
+    def __init__(self):
+        self.objects = []
+
+    def __len__(self):
+        return len(self.objects)
+
+    def add(self, obj):
+        obj._store = self
+        obj._slot = len(self.objects)
+        self.objects.append(obj)
+        return obj
+
+    def remove(self, obj):
+        last = self.objects.pop()
+        if last is not obj:
+            self.objects[obj._slot] = last
+            last._slot = obj._slot
+
+    def clear(self):
+        self.objects.clear()
+
+
+class EntityManager:
+    """
+    Owns the entity groups (EntityList or EntityStore) of one game.
+
+    Every entity item carries the "entity" canvas tag (GameObject adds it),
+    which is what audit() counts. Objects outside any group, like the
+    player, are registered with track() so they are accounted for too.
+    """
+    TAG = "entity"
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._groups = []
+        self._pools = {}     # group -> BulletPool recycling that group's objects
+        self._tracked = []
+        self._doomed = []
+        self.destroyed = 0
+        self.leaked_items = 0
+
+    def add_group(self, group, pool=None):
+        self._groups.append(group)
+        if pool is not None:
+            self._pools[group] = pool
+        return group
+
+    def track(self, obj):
+        self._tracked.append(obj)
+        return obj
+
+    def kill(self, obj):
+        """Mark obj for destruction at the next flush(); killing twice is harmless."""
+        if not obj._dead:
+            obj._dead = True
+            self._doomed.append(obj)
+
+    def flush(self):
+        """Destroy everything killed since the last flush; returns how many."""
+        doomed = self._doomed
+        if not doomed:
+            return 0
+        handles = []
+        for obj in doomed:
+            group = obj._store
+            pool = self._pools.get(group)
+            if pool is not None:
+                pool.release(obj)
+            else:
+                group.remove(obj)
+                handles.append(obj._tag if obj._label_id else obj._id)
+        if handles:
+            self.canvas.delete(*handles)
+        count = len(doomed)
+        self.destroyed += count
+        self._doomed = []
+        return count
+
+    def clear(self):
+        """Delete every entity item and empty the groups (new game)."""
+        self.canvas.delete(self.TAG)
+        for group in self._groups:
+            group.objects.clear()
+        self._tracked.clear()
+        self._doomed = []
+
+    @staticmethod
+    def _items_of(objects):
+        return sum(2 if obj._label_id else 1 for obj in objects)
+
+    def expected_items(self):
+        """Canvas items the live entities (and idle pooled bullets) should own."""
+        items = self._items_of(self._tracked)
+        for group in self._groups:
+            items += self._items_of(group.objects)
+            pool = self._pools.get(group)
+            if pool is not None:
+                items += pool.size - pool.in_use
+        return items
+
+    def audit(self):
+        """Compare expected entity items with what is really on the canvas."""
+        expected = self.expected_items()
+        on_canvas = len(self.canvas.find_withtag(self.TAG))
+        self.leaked_items = on_canvas - expected
+        return {"live_entities": sum(len(g) for g in self._groups) + len(self._tracked),
+                "expected_items": expected, "entity_items": on_canvas,
+                "canvas_items": len(self.canvas.find_all()), "leaked_items": self.leaked_items}
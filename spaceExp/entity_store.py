@@ -0,0 +1,191 @@
+"""
+Struct-of-arrays storage for the many small moving objects (bullets, aliens,
+planets) in spaceEXPvX.
+
+Each entity type gets one EntityStore holding positions, velocities, sizes
+and a per-entity timer in NumPy arrays, so a tick moves, bounces and culls
+the whole type with a handful of array operations instead of one Python
+update() call per object. The GameObject instances are still there for the
+per-object rules (collisions, destroy, shooting); their _x/_y/vx/vy simply
+read and write their row in the store.
+"""
+import numpy as np
+
+
+class Column:
+    """Descriptor mapping an entity attribute onto its row of a store array."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj._store, self.name).item(obj._slot)
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self.name)[obj._slot] = value
+
+
+class StoredEntity:
+    """
+    Mixin for GameObjects that live in an EntityStore. Must come before
+    GameObject in the bases: it claims a row first, so the position that
+    GameObject.__init__ assigns already lands in the arrays.
+    """
+    _x = Column("x")
+    _y = Column("y")
+    _prev_x = Column("prev_x")
+    _prev_y = Column("prev_y")
+    _drawn_x = Column("drawn_x")
+    _drawn_y = Column("drawn_y")
+    vx = Column("vx")
+    vy = Column("vy")
+
+    def __init__(self, store, x, y, size, *args, vx=0.0, vy=0.0, **kwargs):
+        self._store = store
+        self._slot = store.add(self, x, y, vx, vy, size)
+        if store.tag:
+            kwargs["tags"] = (*kwargs.get("tags", ()), store.tag)
+        super().__init__(store.canvas, x, y, size, *args, **kwargs)
+
+
+class EntityStore:
+    """
+    Compact arrays for one entity type. Rows 0..n-1 are live and objects[i]
+    is the entity in row i; removal moves the last row into the hole, so
+    objects stays a dense list the game can iterate and len() directly.
+    Every canvas item of the type carries `tag`, which render() uses to move
+    them all in one call when they share the same motion.
+    """
+    FIELDS = ("x", "y", "vx", "vy", "size", "timer", "prev_x", "prev_y", "drawn_x", "drawn_y")
+
+    def __init__(self, canvas, capacity=256, tag=None):
+        self.canvas = canvas
+        self.tag = tag
+        self.objects = []
+        self._capacity = capacity
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity))
+
+    @property
+    def n(self):
+        return len(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def _grow(self):
+        self._capacity *= 2
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self._capacity)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, obj, x, y, vx, vy, size):
+        slot = len(self.objects)
+        if slot == self._capacity:
+            self._grow()
+        self.objects.append(obj)
+        self.x[slot] = self.prev_x[slot] = self.drawn_x[slot] = x
+        self.y[slot] = self.prev_y[slot] = self.drawn_y[slot] = y
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.size[slot] = size
+        self.timer[slot] = 0.0
+        return slot
+
+    def remove(self, obj):
+        """Swap-remove obj's row (O(1)); the canvas items are left to the caller."""
+        slot = obj._slot
+        last = len(self.objects) - 1
+        if slot != last:
+            moved = self.objects[last]
+            self.objects[slot] = moved
+            moved._slot = slot
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[slot] = arr[last]
+        self.objects.pop()
+
+    # --- bulk operations (one array op per field, whatever the entity count) ---
+    def snapshot(self):
+        n = self.n
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def bounce_x(self, left, right):
+        """Reverse vx for entities touching either wall (checked before moving, as Alien.update did)."""
+        n = self.n
+        x = self.x[:n]
+        hit = (x <= left) | (x >= right)
+        self.vx[:n][hit] *= -1
+
+    def advance(self):
+        n = self.n
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+    def outside(self, left, top, right, bottom):
+        """Entities whose position has left the given rectangle."""
+        n = self.n
+        if not n:
+            return []
+        x, y = self.x[:n], self.y[:n]
+        rows = ((x < left) | (x > right) | (y < top) | (y > bottom)).nonzero()[0]
+        return [self.objects[i] for i in rows.tolist()]
+
+    def due(self, now):
+        """Entities whose timer has expired."""
+        if not self.objects:
+            return []
+        rows = (self.timer[:self.n] < now).nonzero()[0]
+        return [self.objects[i] for i in rows.tolist()]
+
+    def colliding(self, other):
+        """Entities overlapping `other`, using the same circle test as GameObject.collides_with."""
+        n = self.n
+        if not n:
+            return []
+        half = self.size[:n] / 2
+        ox, oy, oh = other._x + other._size / 2, other._y + other._size / 2, other._size / 2
+        dx = self.x[:n] + half - ox
+        dy = self.y[:n] + half - oy
+        reach = half + oh
+        rows = (dx * dx + dy * dy < reach * reach).nonzero()[0]
+        return [self.objects[i] for i in rows.tolist()]
+
+    def render(self, alpha, shared=True):
+        """
+        Move the canvas items of entities whose interpolated position changed.
+
+        With `shared`, the most common (dx, dy) is applied to the whole tag in
+        a single canvas.move and only the entities that moved differently get
+        their own call. Items outside the store that carry the tag (hidden
+        pooled bullets) move along harmlessly; they are repositioned on reuse.
+        """
+        n = self.n
+        if not n:
+            return
+        prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+        ix = prev_x + (self.x[:n] - prev_x) * alpha
+        iy = prev_y + (self.y[:n] - prev_y) * alpha
+        dx = ix - self.drawn_x[:n]
+        dy = iy - self.drawn_y[:n]
+        move = self.canvas.move
+        if shared and self.tag and n > 1:
+            deltas, counts = np.unique(np.stack((dx, dy), axis=1), axis=0, return_counts=True)
+            best = counts.argmax()
+            common_dx, common_dy = deltas[best].tolist()
+            if counts[best] > 1 and (common_dx or common_dy):
+                move(self.tag, common_dx, common_dy)
+                dx = dx - common_dx
+                dy = dy - common_dy
+        rows = ((dx != 0) | (dy != 0)).nonzero()[0]
+        objects = self.objects
+        for i, ddx, ddy in zip(rows.tolist(), dx[rows].tolist(), dy[rows].tolist()):
+            obj = objects[i]
+            move(obj._tag if obj._label_id else obj._id, ddx, ddy)
+        self.drawn_x[:n] = ix
+        self.drawn_y[:n] = iy
@@ -0,0 +1,262 @@
+"""
+Gym-style environment over the spaceEXPvX rules, for training and
+evaluating automated players, plus a vectorised runner that steps many
+games in lockstep across worker processes.
+
+    env = SpaceExplorerEnv(seed=1)
+    obs = env.reset()
+    obs, reward, done, info = env.step(action)
+
+    with VectorEnv(n_envs=64, workers=8, seed=1) as venv:
+        obs = venv.reset()
+        obs, rewards, dones = venv.step(actions)
+
+Observations are float32 arrays of length OBS_SIZE. Each worker writes its
+games' observations, rewards and done flags straight into shared-memory
+arrays, and the parent only sends a one-word command per step, so nothing
+bigger than that is pickled.
+"""
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from spaceEXPvX import SpaceExplorerGame
+
+# Discrete actions: movement (none, Left, Right, Up, Down) x (hold fire, fire)
+MOVES = ((), ("Left",), ("Right",), ("Up",), ("Down",))
+ACTIONS = tuple((keys, fire) for fire in (False, True) for keys in MOVES)
+N_ACTIONS = len(ACTIONS)
+
+# Observation layout: player (x, y, cos, sin, lives, shots in flight), then the
+# NEAREST aliens (dx, dy, vx), alien bullets (dx, dy) and planets (dx, dy),
+# relative to the player, scaled by the canvas size and zero-padded.
+NEAREST = 8
+_PLAYER_FIELDS = 6
+OBS_SIZE = _PLAYER_FIELDS + NEAREST * (3 + 2 + 2)
+
+LIFE_PENALTY = 50
+
+
+def _nearest(store, px, py, k, out, with_vx=False):
+    """Write the k nearest entities of store (relative, scaled) into out; returns columns written."""
+    cols = 3 if with_vx else 2
+    n = store.n
+    if n:
+        dx = (store.x[:n] - px) / SpaceExplorerGame.WIDTH
+        dy = (store.y[:n] - py) / SpaceExplorerGame.HEIGHT
+        d2 = dx * dx + dy * dy
+        rows = np.argpartition(d2, k)[:k] if n > k else np.arange(n)
+        rows = rows[np.argsort(d2[rows])]
+        m = len(rows)
+        view = out[:k * cols].reshape(k, cols)
+        view[:m, 0] = dx[rows]
+        view[:m, 1] = dy[rows]
+        if with_vx:
+            view[:m, 2] = store.vx[rows] / 12
+        view[m:] = 0
+    else:
+        out[:k * cols] = 0
+    return k * cols
+
+
+class SpaceExplorerEnv:
+    """
+    One headless game. step() applies an action index (see ACTIONS) for one
+    fixed simulation step and returns (obs, reward, done, info); reward is
+    the score gained minus LIFE_PENALTY per life lost. An episode ends at
+    game over or after max_steps.
+    """
+
+    def __init__(self, seed=None, max_steps=10_000):
+        self.max_steps = max_steps
+        self.game = SpaceExplorerGame(seed=seed)
+        self.steps = 0
+        self.obs = np.zeros(OBS_SIZE, dtype=np.float32)
+
+    def reset(self, seed=None):
+        game = self.game
+        game.seed = seed if seed is not None else game.rng.getrandbits(32)
+        game.start_new_game()
+        game.keys = set()
+        self.steps = 0
+        return self.observe()
+
+    def step(self, action):
+        game = self.game
+        keys, fire = ACTIONS[action]
+        game.keys = set(keys)
+        if fire:
+            game.shoot()
+        score, lives = game.score, game.lives
+        game.tick()
+        self.steps += 1
+        reward = game.score - score - LIFE_PENALTY * max(lives - game.lives, 0)
+        done = game.game_over or self.steps >= self.max_steps
+        return self.observe(), reward, done, {"score": game.score, "lives": game.lives}
+
+    def observe(self, out=None):
+        """Fill `out` (default: self.obs) with the current observation and return it."""
+        out = self.obs if out is None else out
+        game = self.game
+        player = game.player
+        px, py = player._x, player._y
+        out[0] = px / game.WIDTH
+        out[1] = py / game.HEIGHT
+        out[2] = np.cos(player.angle)
+        out[3] = np.sin(player.angle)
+        out[4] = game.lives / 5
+        out[5] = len(game.bullets) / game.PLAYER_BULLETS
+        i = _PLAYER_FIELDS
+        i += _nearest(game.alien_store, px, py, NEAREST, out[i:], with_vx=True)
+        i += _nearest(game.alien_bullet_store, px, py, NEAREST, out[i:])
+        _nearest(game.planet_store, px, py, NEAREST, out[i:])
+        return out
+
+
+# ---------------- vectorised runner ----------------
+
+class _Buffers:
+    """Shared-memory observation/reward/done/action arrays for n_envs games."""
+    LAYOUT = (("obs", np.float32, (OBS_SIZE,)), ("rewards", np.float32, ()),
+              ("dones", np.bool_, ()), ("actions", np.int16, ()), ("seeds", np.int64, ()))
+
+    def __init__(self, n_envs, name=None):
+        sizes = [n_envs * int(np.prod(shape, dtype=int)) * np.dtype(dtype).itemsize
+                 for _, dtype, shape in self.LAYOUT]
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=sum(sizes))
+        offset = 0
+        for (field, dtype, shape), size in zip(self.LAYOUT, sizes):
+            setattr(self, field, np.ndarray((n_envs, *shape), dtype=dtype,
+                                            buffer=self.shm.buf, offset=offset))
+            offset += size
+
+    def close(self):
+        for field, _, _ in self.LAYOUT:
+            setattr(self, field, None)  # drop the views before closing the mapping
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _worker(conn, shm_name, n_envs, lo, hi, max_steps):
+    """Owns envs lo..hi-1; steps them on command, writing results to shared memory."""
+    buffers = _Buffers(n_envs, shm_name)
+    envs = [SpaceExplorerEnv(max_steps=max_steps) for _ in range(lo, hi)]
+    try:
+        while True:
+            command = conn.recv()
+            if command == "step":
+                for i, env in zip(range(lo, hi), envs):
+                    _, reward, done, _ = env.step(int(buffers.actions[i]))
+                    if done:  # auto-reset; the observation is the new episode's first
+                        env.reset()
+                    env.observe(buffers.obs[i])
+                    buffers.rewards[i] = reward
+                    buffers.dones[i] = done
+            elif command == "reset":
+                for i, env in zip(range(lo, hi), envs):
+                    env.reset(int(buffers.seeds[i]))
+                    env.observe(buffers.obs[i])
+            elif command == "close":
+                break
+            conn.send(None)
+    finally:
+        buffers.close()
+        conn.close()
+
+
+class VectorEnv:
+    """
+    n_envs independent games stepped in lockstep. The games are split over
+    `workers` processes (0 runs them in this process, which is simpler to
+    debug). step(actions) returns (obs, rewards, dones) as views of the
+    shared buffers; they are overwritten by the next step, so copy them if
+    they need to be kept. Finished games are reset automatically.
+    """
+
+    def __init__(self, n_envs, workers=None, seed=0, max_steps=10_000):
+        self.n_envs = n_envs
+        self.workers = min(mp.cpu_count() if workers is None else workers, n_envs)
+        self.seed = seed
+        self._buffers = _Buffers(n_envs)
+        self._conns, self._procs, self._envs = [], [], []
+        if self.workers == 0:
+            self._envs = [SpaceExplorerEnv(max_steps=max_steps) for _ in range(n_envs)]
+            return
+        bounds = np.linspace(0, n_envs, self.workers + 1).astype(int)
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker, daemon=True,
+                              args=(child, self._buffers.shm.name, n_envs, lo, hi, max_steps))
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+
+    def _broadcast(self, command):
+        for conn in self._conns:
+            conn.send(command)
+        for conn in self._conns:
+            conn.recv()
+
+    def reset(self):
+        b = self._buffers
+        b.seeds[:] = self.seed + np.arange(self.n_envs)
+        if self._envs:
+            for i, env in enumerate(self._envs):
+                env.reset(int(b.seeds[i]))
+                env.observe(b.obs[i])
+        else:
+            self._broadcast("reset")
+        return b.obs
+
+    def step(self, actions):
+        b = self._buffers
+        b.actions[:] = actions
+        if self._envs:
+            for i, env in enumerate(self._envs):
+                _, b.rewards[i], done, _ = env.step(int(b.actions[i]))
+                if done:
+                    env.reset()
+                env.observe(b.obs[i])
+                b.dones[i] = done
+        else:
+            self._broadcast("step")
+        return b.obs, b.rewards, b.dones
+
+    def close(self):
+        for conn in self._conns:
+            conn.send("close")
+        for proc in self._procs:
+            proc.join()
+        self._conns, self._procs = [], []
+        if self._buffers is not None:
+            self._buffers.close()
+            self._buffers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def benchmark_vector_env(n_envs=64, workers=None, steps=500, seed=0):
+    """Random-action throughput in environment steps per second (all games combined)."""
+    rng = np.random.default_rng(seed)
+    with VectorEnv(n_envs, workers=workers, seed=seed) as venv:
+        venv.reset()
+        start = time.perf_counter()
+        for _ in range(steps):
+            venv.step(rng.integers(0, N_ACTIONS, n_envs))
+        elapsed = time.perf_counter() - start
+    return {"n_envs": n_envs, "workers": venv.workers, "steps": steps * n_envs,
+            "seconds": round(elapsed, 3), "steps_per_sec": round(steps * n_envs / elapsed)}
+
+
+if __name__ == "__main__":
+    print(benchmark_vector_env(workers=0, n_envs=8))
+    print(benchmark_vector_env())
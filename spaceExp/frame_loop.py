@@ -0,0 +1,153 @@
+"""
+Fixed-timestep game loop with interpolation, the simulation clock, plus
+per-phase frame timing and Tk call counting used by both space-game versions.
+"""
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """
+    Wall-clock milliseconds per phase (spawn, update, collision, render) for
+    the current display frame. end_frame() closes the frame into a history
+    row, which feeds the on-screen overlay and the CSV trace.
+    """
+    PHASES = ("spawn", "update", "collision", "render")
+    SIM_PHASES = ("spawn", "update", "collision")
+
+    def __init__(self, history=3600):
+        self.current = dict.fromkeys(self.PHASES, 0.0)
+        self.rows = deque(maxlen=history)
+        self.frame = 0
+        self._frame_times = deque(maxlen=120)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] = self.current.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def fps(self):
+        if len(self._frame_times) < 2:
+            return 0.0
+        span = self._frame_times[-1] - self._frame_times[0]
+        return (len(self._frame_times) - 1) / span if span else 0.0
+
+    def end_frame(self, **extra):
+        """Close the current frame; extra columns (steps, entity counts...) are added to its row."""
+        now = time.perf_counter()
+        self._frame_times.append(now)
+        row = {"frame": self.frame, "time_s": round(now, 4), "fps": round(self.fps(), 1),
+               "tick_ms": round(sum(self.current.get(p, 0.0) for p in self.SIM_PHASES), 3)}
+        row.update({f"{name}_ms": round(ms, 3) for name, ms in self.current.items()})
+        row.update(extra)
+        self.rows.append(row)
+        self.frame += 1
+        self.current = dict.fromkeys(self.PHASES, 0.0)
+        return row
+
+    def dump_csv(self, path):
+        """Write the frame history for offline analysis; returns the number of rows."""
+        rows = list(self.rows)
+        fields = []
+        for row in rows:
+            fields.extend(k for k in row if k not in fields)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+        return len(rows)
+
+
+class SimClock:
+    """
+    Simulation time in seconds, advanced explicitly by the game (one fixed
+    step at a time) instead of read from the wall clock. Anything that takes
+    a zero-argument clock callable accepts it in place of time.time, which
+    makes timers reproducible and independent of how fast ticks run.
+    Kept as integer milliseconds so repeated steps don't accumulate drift.
+    """
+
+    def __init__(self):
+        self._ms = 0
+
+    def __call__(self):
+        return self._ms / 1000
+
+    def advance(self, ms):
+        self._ms += ms
+
+    def reset(self):
+        self._ms = 0
+
+
+class CountingCanvas:
+    """
+    Wraps a canvas and counts the method calls made on it; on a real Tk
+    canvas each one is a Tcl round-trip. take() returns the count since the
+    last take(), i.e. calls per frame when used once per frame.
+    """
+
+    def __init__(self, canvas):
+        self._canvas = canvas
+        self.calls = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._canvas, name)
+        if not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return attr(*args, **kwargs)
+        setattr(self, name, counted)  # cache, so later lookups skip __getattr__
+        return counted
+
+    def take(self):
+        calls, self.calls = self.calls, 0
+        return calls
+
+
+class FixedTimestepLoop:
+    """
+    Accumulator loop: each display frame adds the real elapsed time and runs
+    as many fixed `step_ms` simulation steps as fit, so game speed no longer
+    depends on how often frames arrive. The leftover fraction of a step is
+    passed to render(alpha) to interpolate positions. Elapsed time is capped
+    at max_steps steps so a stall cannot snowball into ever longer frames.
+    """
+
+    def __init__(self, step, render, step_ms, max_steps=5, clock=time.perf_counter):
+        self._step = step
+        self._render = render
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self._clock = clock
+        self._last = None
+        self._accumulator = 0.0
+        self.alpha = 0.0
+
+    def reset(self):
+        self._last = None
+        self._accumulator = 0.0
+
+    def run_frame(self):
+        """Advance the simulation to the present and render; returns steps taken."""
+        now = self._clock()
+        if self._last is None:
+            self._last = now
+        elapsed = (now - self._last) * 1000
+        self._last = now
+        self._accumulator += min(elapsed, self.step_ms * self.max_steps)
+        steps = 0
+        while self._accumulator >= self.step_ms:
+            self._step()
+            self._accumulator -= self.step_ms
+            steps += 1
+        self.alpha = self._accumulator / self.step_ms
+        self._render(self.alpha)
+        return steps
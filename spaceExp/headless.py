@@ -0,0 +1,149 @@
+"""
+Headless stand-ins for the Tk root and canvas.
+
+The game objects only ever talk to the canvas through create_*/move/coords/
+delete/itemconfig, so the same rules run without a display when they are
+given a HeadlessCanvas. Item state lives in a plain dict, which makes a
+tick cost Python attribute updates instead of Tcl round-trips.
+"""
+import heapq
+import itertools
+
+
+class HeadlessCanvas:
+    """Implements the subset of tk.Canvas used by the space games."""
+
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self._items = {}  # id -> {"coords": [...], "tags": set(), "options": {...}}
+        self._tagged = {}  # tag -> set of ids, so tag lookups don't scan every item
+        self._next_id = itertools.count(1)
+
+    # --- creation ---
+    def _create(self, kind, coords, options):
+        item_id = next(self._next_id)
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        self._items[item_id] = {"kind": kind, "coords": [float(c) for c in coords],
+                                "tags": set(tags), "options": options}
+        for tag in tags:
+            self._tagged.setdefault(tag, set()).add(item_id)
+        return item_id
+
+    def create_oval(self, x0, y0, x1, y1, **options):
+        return self._create("oval", (x0, y0, x1, y1), options)
+
+    def create_rectangle(self, x0, y0, x1, y1, **options):
+        return self._create("rectangle", (x0, y0, x1, y1), options)
+
+    def create_polygon(self, *points, **options):
+        if len(points) == 1:
+            points = points[0]
+        return self._create("polygon", points, options)
+
+    def create_text(self, x, y, **options):
+        return self._create("text", (x, y), options)
+
+    # --- lookup ---
+    def _resolve(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self._items else []
+        if tag_or_id == "all":
+            return list(self._items)
+        return sorted(self._tagged.get(tag_or_id, ()))
+
+    def find_all(self):
+        return tuple(self._items)
+
+    def find_withtag(self, tag_or_id):
+        return tuple(self._resolve(tag_or_id))
+
+    def type(self, tag_or_id):
+        ids = self._resolve(tag_or_id)
+        return self._items[ids[0]]["kind"] if ids else None
+
+    # --- mutation ---
+    def move(self, tag_or_id, dx, dy):
+        for i in self._resolve(tag_or_id):
+            c = self._items[i]["coords"]
+            for n in range(0, len(c), 2):
+                c[n] += dx
+                c[n + 1] += dy
+
+    def coords(self, tag_or_id, *coords):
+        ids = self._resolve(tag_or_id)
+        if not coords:
+            return list(self._items[ids[0]]["coords"]) if ids else []
+        if len(coords) == 1:
+            coords = coords[0]
+        for i in ids:
+            self._items[i]["coords"] = [float(c) for c in coords]
+
+    def itemconfig(self, tag_or_id, **options):
+        tags = options.pop("tags", None)
+        for i in self._resolve(tag_or_id):
+            if tags is not None:
+                self._untag(i)
+                self._items[i]["tags"] = {tags} if isinstance(tags, str) else set(tags)
+                for tag in self._items[i]["tags"]:
+                    self._tagged.setdefault(tag, set()).add(i)
+            self._items[i]["options"].update(options)
+
+    itemconfigure = itemconfig
+
+    def addtag_withtag(self, new_tag, tag_or_id):
+        for i in self._resolve(tag_or_id):
+            self._items[i]["tags"].add(new_tag)
+            self._tagged.setdefault(new_tag, set()).add(i)
+
+    def dtag(self, tag_or_id, tag_to_delete=None):
+        tag_to_delete = tag_to_delete or tag_or_id
+        for i in self._resolve(tag_or_id):
+            self._items[i]["tags"].discard(tag_to_delete)
+            self._tagged.get(tag_to_delete, set()).discard(i)
+
+    def delete(self, *tags_or_ids):
+        for tag_or_id in tags_or_ids:
+            for i in self._resolve(tag_or_id):
+                self._untag(i)
+                del self._items[i]
+
+    def _untag(self, item_id):
+        for tag in self._items[item_id]["tags"]:
+            ids = self._tagged.get(tag)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._tagged[tag]
+
+
+class HeadlessRoot:
+    """Stand-in for tk.Tk: keeps after() callbacks on a simulated millisecond clock."""
+
+    def __init__(self):
+        self.now_ms = 0
+        self._timers = []  # heap of (due_ms, seq, callback)
+        self._seq = itertools.count()
+
+    def title(self, *args):
+        pass
+
+    def resizable(self, *args):
+        pass
+
+    def bind(self, *args):
+        pass
+
+    def after(self, ms, callback):
+        seq = next(self._seq)
+        heapq.heappush(self._timers, (self.now_ms + ms, seq, callback))
+        return seq
+
+    def advance(self, ms):
+        """Move the clock forward and run every callback that has come due."""
+        self.now_ms += ms
+        while self._timers and self._timers[0][0] <= self.now_ms:
+            _, _, callback = heapq.heappop(self._timers)
+            callback()
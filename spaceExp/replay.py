@@ -0,0 +1,123 @@
+"""
+Compact input recordings for spaceEXPvX.
+
+One byte describes the input of one simulation step: bits 0-3 are the
+arrow keys held (Left, Right, Up, Down) and bits 4-7 the number of shots
+fired since the previous step. Together with the game's RNG seed that is
+all a deterministic replay needs.
+
+File layout (little-endian):
+    header   magic, version, step_ms, seed, step count, chunk count, index offset
+    chunks   run-length pairs (input byte, run length) for CHUNK_STEPS steps each
+    index    per chunk: first step, byte offset, pair count
+
+Held keys change rarely, so runs are long and a recording is usually a few
+bytes per second of play. The index lets a reader start decoding at any
+step without walking the chunks before it.
+"""
+import struct
+from bisect import bisect_right
+
+MAGIC = b"SXRP"
+VERSION = 1
+CHUNK_STEPS = 1024
+KEY_BITS = ("Left", "Right", "Up", "Down")
+MAX_SHOTS = 15
+
+_HEADER = struct.Struct("<4sHHQIII")
+_PAIR = struct.Struct("<BH")
+_INDEX = struct.Struct("<III")
+
+
+def encode_input(keys, shots):
+    value = 0
+    for bit, key in enumerate(KEY_BITS):
+        if key in keys:
+            value |= 1 << bit
+    return value | (min(shots, MAX_SHOTS) << 4)
+
+
+def decode_input(value):
+    """Return (held keys, shots) for one step's input byte."""
+    keys = {key for bit, key in enumerate(KEY_BITS) if value & (1 << bit)}
+    return keys, value >> 4
+
+
+class InputRecorder:
+    """Collects one input byte per simulation step; save() writes the replay file."""
+
+    def __init__(self):
+        self.steps = bytearray()
+
+    def __len__(self):
+        return len(self.steps)
+
+    def reset(self):
+        self.steps = bytearray()
+
+    def record(self, keys, shots):
+        self.steps.append(encode_input(keys, shots))
+
+    def save(self, path, seed, step_ms):
+        """Write the recording; returns the file size in bytes."""
+        chunks, index = [], []
+        offset = _HEADER.size
+        for first in range(0, len(self.steps), CHUNK_STEPS):
+            pairs = _run_lengths(self.steps[first:first + CHUNK_STEPS])
+            data = b"".join(_PAIR.pack(value, run) for value, run in pairs)
+            index.append(_INDEX.pack(first, offset, len(pairs)))
+            chunks.append(data)
+            offset += len(data)
+        header = _HEADER.pack(MAGIC, VERSION, step_ms, seed, len(self.steps), len(index), offset)
+        with open(path, "wb") as f:
+            f.write(header)
+            f.writelines(chunks)
+            f.writelines(index)
+        return offset + len(index) * _INDEX.size
+
+
+def _run_lengths(data):
+    pairs = []
+    for value in data:
+        if pairs and pairs[-1][0] == value:
+            pairs[-1][1] += 1
+        else:
+            pairs.append([value, 1])
+    return pairs
+
+
+class Replay:
+    """Reads a replay file; inputs(start) seeks straight to the chunk holding `start`."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, self.step_ms, self.seed, self.steps, chunk_count, index_offset = \
+                _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} replay file")
+            f.seek(index_offset)
+            self._index = [_INDEX.unpack(f.read(_INDEX.size)) for _ in range(chunk_count)]
+        self._first_steps = [entry[0] for entry in self._index]
+
+    def __len__(self):
+        return self.steps
+
+    def inputs(self, start=0, stop=None):
+        """Yield the input byte of each step in [start, stop)."""
+        stop = self.steps if stop is None else min(stop, self.steps)
+        if start >= stop:
+            return
+        chunk = bisect_right(self._first_steps, start) - 1
+        with open(self.path, "rb") as f:
+            for first, offset, pair_count in self._index[chunk:]:
+                if first >= stop:
+                    return
+                f.seek(offset)
+                data = f.read(pair_count * _PAIR.size)
+                step = first
+                for value, run in _PAIR.iter_unpack(data):
+                    lo, hi = max(step, start), min(step + run, stop)
+                    for _ in range(lo, hi):
+                        yield value
+                    step += run
@@ -1,7 +1,15 @@
-import tkinter as tk
+try:
+    import tkinter as tk
+except ImportError:  # headless machines can still run the simulation
+    tk = None
 import random
 import time
+import itertools
 from abc import ABC, abstractmethod
+from spatial_hash import SpatialHash
+from headless import HeadlessCanvas, HeadlessRoot
+from frame_loop import CountingCanvas, FixedTimestepLoop, PhaseTimer, SimClock
+from entity_manager import EntityList, EntityManager
 
 #BASE CLASS (Abstraction + Inheritance)
 class GameObject(ABC):
@@ -11,24 +19,33 @@ class GameObject(ABC):
     'update' method for all concrete, moving subclasses.
     """
 
+    _tag_ids = itertools.count(1)
+    _dead = False  # set by EntityManager.kill(); the object goes at the next flush
+
     # MODIFICATION 1: Added shape_type and points/radius parameters
-    def __init__(self, canvas, x, y, size, color, label_text="", shape_type="oval"):
+    def __init__(self, canvas, x, y, size, color, label_text="", shape_type="oval", tags=()):
         """
         Initializes the game object, creating both the shape
         and an optional text label centered on it.
         """
         self.canvas = canvas
+        # Shape and label share a per-object tag, so one canvas call moves or deletes both
+        self._tag = f"obj{next(self._tag_ids)}"
+        tags = (*tags, EntityManager.TAG, self._tag)
         self._x = x
         self._y = y
         self._size = size
         self._color = color
         self._shape_type = shape_type # Store shape type
         self._id = None
+        # Previous-step and on-canvas positions, used by render() to interpolate
+        self._prev_x, self._prev_y = x, y
+        self._drawn_x, self._drawn_y = x, y
         
         # Determine shape to create based on shape_type
         if shape_type == "oval":
             # For oval (circle) shapes
-            self._id = self.canvas.create_oval(x, y, x + size, y + size, fill=color)
+            self._id = self.canvas.create_oval(x, y, x + size, y + size, fill=color, tags=tags)
         elif shape_type == "polygon":
             # For polygon (triangle) shapes - Player ship specific points (pointing up)
             points = [
@@ -36,7 +53,7 @@ class GameObject(ABC):
                 x, y + size,                # Bottom left corner
                 x + size, y + size          # Bottom right corner
             ]
-            self._id = self.canvas.create_polygon(points, fill=color)
+            self._id = self.canvas.create_polygon(points, fill=color, tags=tags)
         
         # Create the label
         self._label_id = None 
@@ -54,25 +71,31 @@ class GameObject(ABC):
                 center_y, 
                 text=label_text, 
                 fill='black', # Black for good contrast on all colors
-                font=('Arial', font_size, 'bold')
+                font=('Arial', font_size, 'bold'),
+                tags=tags
             )
 
     def move(self, dx, dy):
-        """Move object and its label by dx, dy"""
-        self.canvas.move(self._id, dx, dy)
-        
-        if self._label_id:
-            self.canvas.move(self._label_id, dx, dy)
-            
+        """Move the object's logical position; the canvas catches up in render()"""
         self._x += dx
         self._y += dy
 
+    def snapshot(self):
+        """Remember the position at the start of a simulation step (for interpolation)"""
+        self._prev_x, self._prev_y = self._x, self._y
+
+    def render(self, alpha=1.0):
+        """Draw between the previous and current step positions (alpha 0..1)"""
+        x = self._prev_x + (self._x - self._prev_x) * alpha
+        y = self._prev_y + (self._y - self._prev_y) * alpha
+        dx, dy = x - self._drawn_x, y - self._drawn_y
+        if dx or dy:
+            self.canvas.move(self._tag if self._label_id else self._id, dx, dy)
+            self._drawn_x, self._drawn_y = x, y
+
     def destroy(self):
         """Remove object and its label from canvas"""
-        self.canvas.delete(self._id)
-        
-        if self._label_id:
-            self.canvas.delete(self._label_id)
+        self.canvas.delete(self._tag if self._label_id else self._id)
 
     def position(self):
         """Return current position"""
@@ -83,11 +106,11 @@ class GameObject(ABC):
         x1, y1 = self._x + self._size / 2, self._y + self._size / 2
         x2, y2 = other._x + other._size / 2, other._y + other._size / 2
         
-        # Calculate distance between centers
-        distance = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
-        
-        # Check if distance is less than the sum of their radii/half-sizes
-        return distance < (self._size / 2) + (other._size / 2)
+        # Compare squared distance between centers with the squared sum of
+        # their radii/half-sizes (no square root needed)
+        dx, dy = x1 - x2, y1 - y2
+        reach = (self._size / 2) + (other._size / 2)
+        return dx * dx + dy * dy < reach * reach
 
     @abstractmethod
     def update(self):
@@ -145,16 +168,18 @@ class Player(GameObject):
 class Alien(GameObject):
     """Alien that moves downwards and side to side."""
 
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, x, y, clock=time.time, rng=random):
         # MOD: Alien retains the default 'oval' shape
         super().__init__(canvas, x, y, 30, 'red', label_text='A', shape_type="oval") 
-        self.vx = random.choice([-2, 2])  # horizontal speed
+        self._clock = clock  # simulation clock from the game; time.time when used on its own
+        self._rng = rng
+        self.vx = rng.choice([-2, 2])  # horizontal speed
         self.vy = 1.2                      # downward speed
-        self._direction_timer = time.time()
+        self._direction_timer = clock()
         self.CANVAS_WIDTH = 800 
         
-        self._shoot_timer = time.time()
-        self._shoot_interval = random.uniform(2, 5) 
+        self._shoot_timer = clock()
+        self._shoot_interval = rng.uniform(2, 5) 
 
     def shoot(self):
         """Creates a new Alien Bullet object at the alien's position."""
@@ -167,9 +192,10 @@ class Alien(GameObject):
         Moves the alien, handles direction change, and shooting.
         """
         # Switch horizontal direction every 2 seconds
-        if time.time() - self._direction_timer > 2:
+        now = self._clock()
+        if now - self._direction_timer > 2:
             self.vx *= -1
-            self._direction_timer = time.time()
+            self._direction_timer = now
         
         # Bounce off the side walls
         if self._x <= 0 or self._x >= self.CANVAS_WIDTH - self._size:
@@ -177,11 +203,11 @@ class Alien(GameObject):
              
         self.move(self.vx, self.vy)
         
-        if time.time() - self._shoot_timer > self._shoot_interval:
+        if now - self._shoot_timer > self._shoot_interval:
             new_bullet = self.shoot()
             
-            self._shoot_timer = time.time()
-            self._shoot_interval = random.uniform(2, 5) 
+            self._shoot_timer = now
+            self._shoot_interval = self._rng.uniform(2, 5) 
             
             return new_bullet 
         
@@ -192,21 +218,19 @@ class Alien(GameObject):
 class Planet(GameObject):
     """Decorative planet that floats slowly."""
 
-    def __init__(self, canvas, x, y, size):
-        color = random.choice(['#2E8B57', '#4682B4', '#DAA520']) 
+    def __init__(self, canvas, x, y, size, rng=random):
+        color = rng.choice(['#2E8B57', '#4682B4', '#DAA520']) 
         # MOD: Planet retains the default 'oval' shape
         super().__init__(canvas, x, y, size, color, label_text='P', shape_type="oval") 
-        self.vy = random.uniform(0.4, 0.7)  # vertical speed
+        self.vy = rng.uniform(0.4, 0.7)  # vertical speed
         self.CANVAS_HEIGHT = 600 
 
     def update(self):
         """
         Polymorphic update method.
-        Moves the planet down and destroys it if it goes off-screen.
+        Moves the planet down (the game removes it once it is off-screen).
         """
         self.move(0, self.vy)
-        if self._y > self.CANVAS_HEIGHT:
-            self.destroy() 
 
 
 # BULLET CLASS (Modified to handle alien bullets) 
@@ -224,11 +248,9 @@ class Bullet(GameObject):
     def update(self):
         """
         Polymorphic update method.
-        Moves the bullet and destroys it if it goes off-screen.
+        Moves the bullet (the game removes it once it is off-screen).
         """
         self.move(0, self.speed)
-        if self._y < 0 or self._y > self.CANVAS_HEIGHT:
-            self.destroy()
 
 
 #MAIN GAME CLASS (Modified to handle alien bullets)
@@ -238,17 +260,46 @@ class SpaceExplorerGame:
     # Define constants for canvas size
     CANVAS_WIDTH = 800
     CANVAS_HEIGHT = 600
+    STEP_MS = 40     # fixed simulation step (the game's speeds are tuned for it)
+    RENDER_MS = 16   # display frame interval; positions are interpolated between steps
+    AUDIT_FRAMES = 60  # how often the canvas is checked for leaked entity items
+    ALIEN_SPAWN_RATE = 0.03   # chance per step of a new alien
+    PLANET_SPAWN_RATE = 0.008  # chance per step of a new planet
 
-    def __init__(self, root):
-        self.root = root
+    def __init__(self, root=None, seed=None, clock=None):
+        """
+        With a Tk root the game draws on a tk.Canvas and schedules itself.
+        With root=None it runs headless: same rules on a HeadlessCanvas,
+        advanced by calling tick() as fast as the caller likes.
+        Alien timers read `clock` (simulation time unless one is passed in)
+        and all randomness comes from an RNG seeded with `seed`, so a seed
+        plus the same input reproduces a game exactly.
+        """
+        self.headless = root is None
+        self.root = HeadlessRoot() if self.headless else root
         self.root.title("Space Explorer Game")
-        self.canvas = tk.Canvas(root, width=self.CANVAS_WIDTH, height=self.CANVAS_HEIGHT, bg='black')
-        self.canvas.pack()
-
-        # Game state variables
-        self.player = Player(self.canvas, self.CANVAS_WIDTH // 2 - 15, self.CANVAS_HEIGHT - 100)
-        self.aliens, self.planets, self.bullets = [], [], []
-        self.alien_bullets = [] 
+        if self.headless:
+            self.canvas = HeadlessCanvas(self.CANVAS_WIDTH, self.CANVAS_HEIGHT)
+        else:
+            self.canvas = tk.Canvas(root, width=self.CANVAS_WIDTH, height=self.CANVAS_HEIGHT, bg='black')
+            self.canvas.pack()
+        # Every canvas call is counted; the frame trace reports Tk calls per frame
+        self.canvas = CountingCanvas(self.canvas)
+
+        self.clock = SimClock() if clock is None else clock
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+
+        # Game state variables — entities are created into manager groups and killed
+        # through the manager, which destroys them in one batch per phase
+        self.entities = EntityManager(self.canvas)
+        self.alien_group = self.entities.add_group(EntityList())
+        self.planet_group = self.entities.add_group(EntityList())
+        self.bullet_group = self.entities.add_group(EntityList())
+        self.alien_bullet_group = self.entities.add_group(EntityList())
+        self.aliens, self.planets = self.alien_group.objects, self.planet_group.objects
+        self.bullets, self.alien_bullets = self.bullet_group.objects, self.alien_bullet_group.objects
+        self.player = self.entities.track(Player(self.canvas, self.CANVAS_WIDTH // 2 - 15, self.CANVAS_HEIGHT - 100))
         self.lives = 5
         self.score = 0
         self.planets_collected = 0 
@@ -256,6 +307,17 @@ class SpaceExplorerGame:
         self._game_over = False 
         self.end_message_ids = [] 
 
+        # Collision broad-phase: aliens are re-bucketed every tick
+        self.alien_grid = SpatialHash(cell_size=64)
+        self.collision_pairs = 0     # narrow-phase checks done last tick
+        self.brute_force_pairs = 0   # checks the old nested loop would have done
+
+        # Fixed-timestep loop and frame instrumentation (F3 overlay, F4 CSV dump)
+        self.timer = PhaseTimer()
+        self.loop = FixedTimestepLoop(self.step, self.render, self.STEP_MS)
+        self.show_overlay = False
+        self.overlay_id = None
+
         # UI elements
         self.lives_label = self.canvas.create_text(
             60, 30, text="Lives: 5", fill='white', font=('Arial', 16), anchor='w'
@@ -277,13 +339,16 @@ class SpaceExplorerGame:
         self.root.bind("p", lambda e: self.toggle_pause())
         self.root.bind("x", lambda e: self.stop_game())
         self.root.bind("<Return>", lambda e: self.reset_game()) 
+        self.root.bind("<F3>", lambda e: self.toggle_overlay())
+        self.root.bind("<F4>", lambda e: self.timer.dump_csv("frame_trace.csv"))
 
-        self.update_game()
+        if not self.headless:
+            self.update_game()
 
     def shoot_bullet(self):
         """Fire a player bullet only if the game isn’t paused and is not over."""
         if not self.paused and not self._game_over:
-            self.bullets.append(self.player.shoot())
+            self.bullet_group.add(self.player.shoot())
 
     def toggle_pause(self):
         """Pause or resume the game."""
@@ -306,12 +371,7 @@ class SpaceExplorerGame:
         if not self._game_over and not self.paused:
             return
 
-        for obj_list in [self.aliens, self.planets, self.bullets, self.alien_bullets]:
-            for obj in obj_list:
-                obj.destroy()
-        
-        if hasattr(self, 'player') and self.player:
-             self.player.destroy()
+        self.entities.clear()  # every entity item, player included, in one canvas call
 
         for msg_id in self.end_message_ids:
             self.canvas.delete(msg_id)
@@ -321,14 +381,13 @@ class SpaceExplorerGame:
             self.canvas.delete(self.pause_label)
             self.pause_label = None
             
-        self.aliens, self.planets, self.bullets, self.alien_bullets = [], [], [], []
         self.lives = 5
         self.score = 0
         self.planets_collected = 0
         self.paused = False
         self._game_over = False
 
-        self.player = Player(self.canvas, self.CANVAS_WIDTH // 2 - 15, self.CANVAS_HEIGHT - 100)
+        self.player = self.entities.track(Player(self.canvas, self.CANVAS_WIDTH // 2 - 15, self.CANVAS_HEIGHT - 100))
         
         self.update_ui()
 
@@ -357,25 +416,82 @@ class SpaceExplorerGame:
         self.root.after(duration_ms, lambda: self.canvas.delete(msg_id))
 
     def update_game(self):
-        """Main game loop — updates all entities and checks collisions."""
+        """Main game loop — catch the simulation up in fixed steps, draw, schedule the next frame."""
+        steps = self.loop.run_frame()
+        if self.timer.frame % self.AUDIT_FRAMES == 0:
+            self.entities.audit()
+        row = self.timer.end_frame(steps=steps, entities=self.entity_count(), tk_calls=self.canvas.take(),
+                                   leaked_items=self.entities.leaked_items)
+        self.update_overlay(row)
+        self.root.after(self.RENDER_MS, self.update_game)
+
+    def tick(self, render=False):
+        """Headless frame: one step, then fire any timers (e.g. temp messages) that fell due."""
+        self.step()
+        if render:
+            self.render(1.0)
+        self.root.advance(self.STEP_MS)
+
+    def entity_count(self):
+        return len(self.aliens) + len(self.planets) + len(self.bullets) + len(self.alien_bullets) + 1
+
+    def step(self):
+        """One fixed step of the game rules: spawn, update, collide."""
         if self.paused or self._game_over:
-            self.root.after(40, self.update_game)
             return
+        if isinstance(self.clock, SimClock):
+            self.clock.advance(self.STEP_MS)
+        with self.timer.phase("spawn"):
+            self.spawn_entities()
+        with self.timer.phase("update"):
+            self.update_entities()
+            self.entities.flush()
+        with self.timer.phase("collision"):
+            self.check_collisions()
+            self.entities.flush()
+
+    def spawn_entities(self):
+        rng = self.rng
+        if rng.random() < self.PLANET_SPAWN_RATE:
+            self.planet_group.add(Planet(self.canvas, rng.randint(0, self.CANVAS_WIDTH - 20), -40, rng.randint(20, 40), rng))
+
+        if rng.random() < self.ALIEN_SPAWN_RATE:
+            self.alien_group.add(Alien(self.canvas, rng.randint(0, self.CANVAS_WIDTH - 20), -40, self.clock, rng))
+
+    def update_entities(self):
+        """Move everything one step and kill what has left the screen."""
+        for obj_list in (self.planets, self.aliens, self.bullets, self.alien_bullets):
+            for obj in obj_list:
+                obj.snapshot()
+        self.player.snapshot()
 
-        # --- Spawning ---
-        if random.random() < 0.008:
-            self.planets.append(Planet(self.canvas, random.randint(0, self.CANVAS_WIDTH - 20), -40, random.randint(20, 40)))
+        for planet in self.planets:
+            planet.update()
+            if planet.position()[1] > self.CANVAS_HEIGHT: 
+                self.entities.kill(planet)
 
-        if random.random() < 0.03:
-            self.aliens.append(Alien(self.canvas, random.randint(0, self.CANVAS_WIDTH - 20), -40))
+        for alien in self.aliens:
+            new_bullet = alien.update()
+            if new_bullet:
+                self.alien_bullet_group.add(new_bullet)
+            if alien.position()[1] > self.CANVAS_HEIGHT:
+                self.entities.kill(alien)
 
-        # --- Updating and Collision (Planet Loop) ---
-        for planet in self.planets[:]:
-            planet.update()
-            
+        for bullet in self.bullets:
+            bullet.update()
+            if bullet.position()[1] < 0:
+                self.entities.kill(bullet)
+
+        for alien_bullet in self.alien_bullets:
+            alien_bullet.update()
+            if alien_bullet.position()[1] > self.CANVAS_HEIGHT:
+                self.entities.kill(alien_bullet)
+
+    def check_collisions(self):
+        # --- Planets collected by the player ---
+        for planet in self.planets:
             if planet.collides_with(self.player):
-                planet.destroy()
-                self.planets.remove(planet)
+                self.entities.kill(planet)
                 self.planets_collected += 1
                 
                 if self.planets_collected % 5 == 0 and self.planets_collected > 0:
@@ -383,25 +499,11 @@ class SpaceExplorerGame:
                     self.show_temp_message("EXTRA LIFE!", "cyan") 
                 
                 self.update_ui() 
-                continue 
-
-            if planet.position()[1] > self.CANVAS_HEIGHT: 
-                self.planets.remove(planet)
 
-        # --- Updating and Collision (Alien Loop) ---
-        for alien in self.aliens[:]:
-            new_bullet = alien.update()
-            if new_bullet:
-                self.alien_bullets.append(new_bullet)
-            
-            if alien.position()[1] > self.CANVAS_HEIGHT:
-                alien.destroy()
-                self.aliens.remove(alien)
-                continue 
-            
+        # --- Aliens ramming the player ---
+        for alien in self.aliens:
             if alien.collides_with(self.player):
-                alien.destroy()
-                self.aliens.remove(alien)
+                self.entities.kill(alien)
                 self.lives -= 1
                 self.show_temp_message("HIT! -1 Life", "red") 
                 self.update_ui()
@@ -409,45 +511,24 @@ class SpaceExplorerGame:
                     self.game_over()
                     return 
 
-        # --- Updating and Collision (Player Bullet Loop) ---
-        for bullet in self.bullets[:]:
-            bullet.update()
-            
-            if bullet.position()[1] < 0:
-                self.bullets.remove(bullet)
-                continue
-
-            hit_an_alien = False
-            for alien in self.aliens[:]:
-                if bullet.collides_with(alien):
-                    bullet.destroy()
-                    alien.destroy()
-                    
-                    if bullet in self.bullets:
-                        self.bullets.remove(bullet)
-                    if alien in self.aliens:
-                        self.aliens.remove(alien)
-                        
-                    self.score += 10
-                    self.update_ui()
-                    hit_an_alien = True
-                    break 
-            
-            if hit_an_alien:
-                continue 
+        # --- Player bullets vs aliens (spatial hash broad-phase) ---
+        self.entities.flush()  # aliens that rammed the player can't be shot as well
+        self.alien_grid.rebuild(self.aliens)
+        self.brute_force_pairs = len(self.bullets) * len(self.aliens)
+        for bullet in self.bullets:
+            alien = self.alien_grid.first_hit(bullet)
+            if alien:
+                self.entities.kill(bullet)
+                self.entities.kill(alien)
+                self.alien_grid.remove(alien)
+                self.score += 10
+                self.update_ui()
+        self.collision_pairs = self.alien_grid.pairs_tested
         
-        # --- Updating and Collision (Alien Bullet Loop) ---
-        for alien_bullet in self.alien_bullets[:]:
-            alien_bullet.update()
-
-            if alien_bullet.position()[1] > self.CANVAS_HEIGHT:
-                self.alien_bullets.remove(alien_bullet)
-                continue
-
+        # --- Alien bullets vs player ---
+        for alien_bullet in self.alien_bullets:
             if alien_bullet.collides_with(self.player):
-                alien_bullet.destroy()
-                if alien_bullet in self.alien_bullets:
-                    self.alien_bullets.remove(alien_bullet)
+                self.entities.kill(alien_bullet)
                 
                 self.lives -= 1
                 self.show_temp_message("SHOT DOWN! -1 Life", "red") 
@@ -456,7 +537,32 @@ class SpaceExplorerGame:
                     self.game_over()
                     return
 
-        self.root.after(40, self.update_game)
+    def render(self, alpha):
+        """Move every canvas item to its interpolated position."""
+        with self.timer.phase("render"):
+            for obj_list in (self.planets, self.aliens, self.bullets, self.alien_bullets):
+                for obj in obj_list:
+                    obj.render(alpha)
+            self.player.render()  # moved by key events, so drawn at its latest position
+
+    def toggle_overlay(self):
+        """Show/hide the FPS and frame-time overlay (bound to F3)."""
+        self.show_overlay = not self.show_overlay
+        if not self.show_overlay and self.overlay_id:
+            self.canvas.delete(self.overlay_id)
+            self.overlay_id = None
+
+    def update_overlay(self, row):
+        if not self.show_overlay or row["frame"] % 10:
+            return
+        text = (f"FPS {row['fps']:.0f} | tick {row['tick_ms']:.2f} ms | render {row['render_ms']:.2f} ms"
+                f" | entities {row['entities']} | tk calls {row['tk_calls']} | leaked {row['leaked_items']}")
+        if self.overlay_id is None:
+            self.overlay_id = self.canvas.create_text(
+                self.CANVAS_WIDTH // 2, self.CANVAS_HEIGHT - 15, text=text, fill='lime', font=('Courier', 11)
+            )
+        else:
+            self.canvas.itemconfig(self.overlay_id, text=text)
 
     def update_ui(self):
         """Update the score and lives labels"""
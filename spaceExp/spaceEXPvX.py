@@ -1,23 +1,44 @@
-import tkinter as tk
+try:
+    import tkinter as tk
+except ImportError:  # headless machines can still run the simulation
+    tk = None
 import random
+import sys
 import time
 import math
+import itertools
 from abc import ABC, abstractmethod
+from spatial_hash import SpatialHash
+from headless import HeadlessCanvas, HeadlessRoot
+from frame_loop import CountingCanvas, FixedTimestepLoop, PhaseTimer, SimClock
+from entity_store import EntityStore, StoredEntity, Column
+from bullet_pool import BulletPool
+from entity_manager import EntityManager
+from replay import InputRecorder, Replay, decode_input
 
 
 # ========== BASE CLASS ==========
 class GameObject(ABC):
-    def __init__(self, canvas, x, y, size, color, label_text="", shape_type="oval"):
+    _tag_ids = itertools.count(1)
+    _dead = False  # set by EntityManager.kill(); the object goes at the next flush
+
+    def __init__(self, canvas, x, y, size, color, label_text="", shape_type="oval", tags=()):
         self.canvas = canvas
+        # Shape and label share a per-object tag, so one canvas call moves or deletes both
+        self._tag = f"obj{next(self._tag_ids)}"
+        tags = (*tags, EntityManager.TAG, self._tag)
         self._x = x
         self._y = y
         self._size = size
         self._color = color
         self._shape_type = shape_type
         self._id = None
+        # Previous-step and on-canvas positions, used by render() to interpolate
+        self._prev_x, self._prev_y = x, y
+        self._drawn_x, self._drawn_y = x, y
 
         if shape_type == "oval":
-            self._id = canvas.create_oval(x, y, x + size, y + size, fill=color, outline="")
+            self._id = canvas.create_oval(x, y, x + size, y + size, fill=color, outline="", tags=tags)
         elif shape_type == "polygon":
             half = size / 2
             points = [
@@ -25,27 +46,34 @@ class GameObject(ABC):
                 x, y,
                 x, y + size
             ]
-            self._id = canvas.create_polygon(points, fill=color, outline="")
+            self._id = canvas.create_polygon(points, fill=color, outline="", tags=tags)
 
         self._label_id = None
         if label_text:
             cx = x + size / 2
             cy = y + size / 2
             font_size = max(8, int(size / 2.5))
-            self._label_id = canvas.create_text(cx, cy, text=label_text,
+            self._label_id = canvas.create_text(cx, cy, text=label_text, tags=tags,
                                                 fill='black', font=('Arial', font_size, 'bold'))
 
     def move(self, dx, dy):
-        self.canvas.move(self._id, dx, dy)
-        if self._label_id:
-            self.canvas.move(self._label_id, dx, dy)
+        # Logical position only; the canvas item catches up in render()
         self._x += dx
         self._y += dy
 
+    def snapshot(self):
+        self._prev_x, self._prev_y = self._x, self._y
+
+    def render(self, alpha=1.0):
+        x = self._prev_x + (self._x - self._prev_x) * alpha
+        y = self._prev_y + (self._y - self._prev_y) * alpha
+        dx, dy = x - self._drawn_x, y - self._drawn_y
+        if dx or dy:
+            self.canvas.move(self._tag if self._label_id else self._id, dx, dy)
+            self._drawn_x, self._drawn_y = x, y
+
     def destroy(self):
-        self.canvas.delete(self._id)
-        if self._label_id:
-            self.canvas.delete(self._label_id)
+        self.canvas.delete(self._tag if self._label_id else self._id)
 
     def position(self):
         return self._x, self._y
@@ -55,7 +83,9 @@ class GameObject(ABC):
         y1 = self._y + self._size / 2
         x2 = other._x + other._size / 2
         y2 = other._y + other._size / 2
-        return math.hypot(x1 - x2, y1 - y2) < (self._size / 2 + other._size / 2)
+        dx, dy = x1 - x2, y1 - y2
+        reach = self._size / 2 + other._size / 2
+        return dx * dx + dy * dy < reach * reach
 
     @abstractmethod
     def update(self):
@@ -101,6 +131,14 @@ class Player(GameObject):
         if self._label_id:
             self.canvas.itemconfig(self._label_id, angle=math.degrees(self.angle))
 
+    def render(self, alpha=1.0):
+        # The hull is already placed by _update_rotation(); only the label trails behind
+        dx, dy = self._x - self._drawn_x, self._y - self._drawn_y
+        if dx or dy:
+            if self._label_id:
+                self.canvas.move(self._label_id, dx, dy)
+            self._drawn_x, self._drawn_y = self._x, self._y
+
     def move_left(self):   self._move(-self._speed, 0, -1, 0)
     def move_right(self):  self._move(self._speed, 0, 1, 0)
     def move_up(self):     self._move(0, -self._speed, 0, -1)
@@ -113,26 +151,27 @@ class Player(GameObject):
             self.move(0, dy)
         self._update_rotation(dir_x, dir_y)
 
-    def shoot(self):
+    def shoot(self, pool):
         cx = self._x + self._size / 2
         cy = self._y + self._size / 2
         tip_x = cx + (self._size / 2) * math.cos(self.angle)
         tip_y = cy + (self._size / 2) * math.sin(self.angle)
 
         speed = 12
-        return Bullet(self.canvas, tip_x - 3, tip_y - 3,
-                      speed * math.cos(self.angle), speed * math.sin(self.angle))
+        return pool.acquire(tip_x - 3, tip_y - 3,
+                            speed * math.cos(self.angle), speed * math.sin(self.angle))
 
     def update(self):
         pass
 
 
 # ========== BULLET ==========
-class Bullet(GameObject):
-    def __init__(self, canvas, x, y, vx, vy, color='white', is_alien=False):
+# Bullets, aliens and planets keep their position/velocity in an EntityStore;
+# the game advances each store in bulk, update() is the single-object version.
+class Bullet(StoredEntity, GameObject):
+    def __init__(self, store, x, y, vx, vy, color='white', is_alien=False):
         size = 6 if not is_alien else 5
-        super().__init__(canvas, x, y, size, color, shape_type="oval")
-        self.vx, self.vy = vx, vy
+        super().__init__(store, x, y, size, color, shape_type="oval", vx=vx, vy=vy)
 
     def update(self):
         self.move(self.vx, self.vy)
@@ -142,32 +181,28 @@ class Bullet(GameObject):
 
 
 # ========== ALIEN & PLANET ==========
-class Alien(GameObject):
-    def __init__(self, canvas, x, y):
-        super().__init__(canvas, x, y, 35, 'red', 'A', shape_type="oval")
-        self.vx = random.choice([-2, 2])
-        self.vy = 1.5
-        self.next_shoot = time.time() + random.uniform(1, 4)
+class Alien(StoredEntity, GameObject):
+    next_shoot = Column("timer")
 
-    def shoot(self):
-        return Bullet(self.canvas, self._x + 16, self._y + 35, 0, 7, 'orange', True)
+    def __init__(self, store, x, y, clock=time.time, rng=random):
+        super().__init__(store, x, y, 35, 'red', 'A', shape_type="oval",
+                         vx=rng.choice([-2, 2]), vy=1.5)
+        self.next_shoot = clock() + rng.uniform(1, 4)
 
-    def update(self):
-        if time.time() > self.next_shoot:
-            self.next_shoot = time.time() + random.uniform(2, 5)
-            return self.shoot()
+    def shoot(self, pool):
+        return pool.acquire(self._x + 16, self._y + 35, 0, 7)
 
+    def update(self):
         if self._x <= 0 or self._x >= 765:
             self.vx *= -1
         self.move(self.vx, self.vy)
-        return None
 
 
-class Planet(GameObject):
-    def __init__(self, canvas, x, y, size):
-        color = random.choice(['#2E8B57', '#4682B4', '#DAA520', '#8B4513', '#9932CC'])
-        super().__init__(canvas, x, y, size, color, 'P', shape_type="oval")
-        self.vy = random.uniform(0.6, 1.3)
+class Planet(StoredEntity, GameObject):
+    def __init__(self, store, x, y, size, rng=random):
+        color = rng.choice(['#2E8B57', '#4682B4', '#DAA520', '#8B4513', '#9932CC'])
+        super().__init__(store, x, y, size, color, 'P', shape_type="oval",
+                         vy=rng.uniform(0.6, 1.3))
 
     def update(self):
         self.move(0, self.vy)
@@ -176,31 +211,68 @@ class Planet(GameObject):
 # ========== MAIN GAME ==========
 class SpaceExplorerGame:
     WIDTH, HEIGHT = 800, 600
-
-    def __init__(self, root):
-        self.root = root
+    STEP_MS = 16     # fixed simulation step
+    RENDER_MS = 16   # display frame interval; positions are interpolated between steps
+    PLAYER_BULLETS = 8    # also the cap on player shots in flight
+    ALIEN_BULLETS = 256
+    AUDIT_FRAMES = 60  # how often the canvas is checked for leaked entity items
+    ALIEN_SPAWN_RATE = 0.02   # chance per step of a new alien
+    PLANET_SPAWN_RATE = 0.008  # chance per step of a new planet
+
+    def __init__(self, root=None, seed=None, clock=None):
+        # root=None runs headless: same rules on a HeadlessCanvas, driven by tick()
+        self.headless = root is None
+        self.root = HeadlessRoot() if self.headless else root
         self.root.title("Space Explorer - Directional Shooter")
         self.root.resizable(False, False)
 
-        # Canvas
-        self.canvas = tk.Canvas(root, width=self.WIDTH, height=self.HEIGHT, bg='black')
-        self.canvas.pack()
+        if self.headless:
+            self.canvas = HeadlessCanvas(self.WIDTH, self.HEIGHT)
+            self.pause_btn = self.restart_btn = None
+        else:
+            # Canvas
+            self.canvas = tk.Canvas(root, width=self.WIDTH, height=self.HEIGHT, bg='black')
+            self.canvas.pack()
+
+            # Control Frame (buttons)
+            btn_frame = tk.Frame(root)
+            btn_frame.pack(pady=5)
 
-        # Control Frame (buttons)
-        btn_frame = tk.Frame(root)
-        btn_frame.pack(pady=5)
+            self.pause_btn = tk.Button(btn_frame, text="Pause", width=10, command=self.toggle_pause)
+            self.pause_btn.pack(side=tk.LEFT, padx=5)
 
-        self.pause_btn = tk.Button(btn_frame, text="Pause", width=10, command=self.toggle_pause)
-        self.pause_btn.pack(side=tk.LEFT, padx=5)
+            self.restart_btn = tk.Button(btn_frame, text="Restart", width=10, command=self.restart_game)
+            self.restart_btn.pack(side=tk.LEFT, padx=5)
 
-        self.restart_btn = tk.Button(btn_frame, text="Restart", width=10, command=self.restart_game)
-        self.restart_btn.pack(side=tk.LEFT, padx=5)
+        # Every canvas call is counted; the frame trace reports Tk calls per frame
+        self.canvas = CountingCanvas(self.canvas)
 
         # Game state
         self.paused = False
         self.game_over = False
         self.keys = set()
 
+        # Determinism: game timers read self.clock (simulation time by default),
+        # all randomness comes from self.rng, reseeded with self.seed per game,
+        # and the held keys + shots of every step are recorded (F6 saves them)
+        self.clock = SimClock() if clock is None else clock
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.recorder = InputRecorder()
+        self._shots = 0
+
+        # Collision broad-phase: aliens are re-bucketed every frame
+        self.alien_grid = SpatialHash(cell_size=64)
+        self.collision_pairs = 0     # narrow-phase checks done last frame
+        self.brute_force_pairs = 0   # checks the old nested loop would have done
+
+        # Fixed-timestep loop and frame instrumentation (F3 overlay, F4 CSV dump)
+        self.timer = PhaseTimer()
+        self.loop = FixedTimestepLoop(self.step, self.render, self.STEP_MS)
+        self.show_overlay = False
+        self.batched_render = True  # F5: move same-motion entities with one call per tag
+        self.overlay_id = None
+
         # UI Text
         self.score = 0
         self.lives = 5
@@ -213,15 +285,30 @@ class SpaceExplorerGame:
 
         # Start game
         self.start_new_game()
+        if not self.headless:
+            self.game_loop()
 
         # Bind keys
         self.root.bind("<KeyPress>", lambda e: self.keys.add(e.keysym))
         self.root.bind("<KeyRelease>", lambda e: self.keys.discard(e.keysym))
         self.root.bind("<space>", lambda e: self.shoot())
+        self.root.bind("<F3>", lambda e: self.toggle_overlay())
+        self.root.bind("<F4>", lambda e: self.timer.dump_csv("frame_trace.csv"))
+        self.root.bind("<F5>", lambda e: setattr(self, "batched_render", not self.batched_render))
+        self.root.bind("<F6>", lambda e: self.save_replay("replay.sxr"))
+
+    def _set_pause_text(self, text):
+        if self.pause_btn:
+            self.pause_btn.config(text=text)
 
     def start_new_game(self):
         # Clear everything
         self.canvas.delete("all")
+        self.rng.seed(self.seed)
+        if isinstance(self.clock, SimClock):
+            self.clock.reset()
+        self.recorder.reset()
+        self._shots = 0
         self.game_over = False
         self.paused = False
         self.score = 0
@@ -234,43 +321,68 @@ class SpaceExplorerGame:
         self.lives_text = self.canvas.create_text(70, 60, text="Lives: 5", fill="white", font=("Arial", 16), anchor="w")
         self.planets_text = self.canvas.create_text(self.WIDTH-70, 30, text="Planets: 0", fill="white", font=("Arial", 16), anchor="e")
 
-        # Create player
-        self.player = Player(self.canvas, self.WIDTH//2 - 20, self.HEIGHT - 100)
-        self.bullets = []
-        self.aliens = []
-        self.planets = []
-        self.alien_bullets = []
+        # Create player; every entity is killed through the manager, which
+        # destroys them in one batch per phase
+        self.entities = EntityManager(self.canvas)
+        self.player = self.entities.track(Player(self.canvas, self.WIDTH//2 - 20, self.HEIGHT - 100))
+
+        # One struct-of-arrays store per entity type; the lists are the stores' live objects
+        self.bullet_store = EntityStore(self.canvas, tag="bullet")
+        self.alien_store = EntityStore(self.canvas, tag="alien")
+        self.alien_bullet_store = EntityStore(self.canvas, tag="alien_bullet")
+        self.planet_store = EntityStore(self.canvas, tag="planet")
+        self.stores = (self.bullet_store, self.alien_store, self.alien_bullet_store, self.planet_store)
+        self.bullets = self.bullet_store.objects
+
+        # Bullets and their ovals are preallocated once per game and recycled
+        self.bullet_pool = BulletPool(self.bullet_store, self.PLAYER_BULLETS,
+                                      lambda store: Bullet(store, -100, -100, 0, 0))
+        self.alien_bullet_pool = BulletPool(self.alien_bullet_store, self.ALIEN_BULLETS,
+                                            lambda store: Bullet(store, -100, -100, 0, 0, 'orange', True))
+        self.aliens = self.alien_store.objects
+        self.alien_bullets = self.alien_bullet_store.objects
+        self.planets = self.planet_store.objects
+        self.entities.add_group(self.bullet_store, self.bullet_pool)
+        self.entities.add_group(self.alien_store)
+        self.entities.add_group(self.alien_bullet_store, self.alien_bullet_pool)
+        self.entities.add_group(self.planet_store)
 
         if self.pause_overlay:
             self.canvas.delete(self.pause_overlay)
             self.pause_overlay = None
+        self.overlay_id = None  # wiped by delete("all"); recreated on the next refresh
 
-        self.pause_btn.config(text="Pause")
-        self.game_loop()
+        self._set_pause_text("Pause")
 
     def toggle_pause(self):
         if self.game_over:
             return
         self.paused = not self.paused
         if self.paused:
-            self.pause_btn.config(text="Resume")
+            self._set_pause_text("Resume")
             if not self.pause_overlay:
                 self.pause_overlay = self.canvas.create_text(
                     self.WIDTH//2, self.HEIGHT//2, text="PAUSED", fill="yellow",
                     font=("Arial", 50, "bold")
                 )
         else:
-            self.pause_btn.config(text="Pause")
+            self._set_pause_text("Pause")
             if self.pause_overlay:
                 self.canvas.delete(self.pause_overlay)
                 self.pause_overlay = None
 
     def restart_game(self):
+        self.seed = self.rng.getrandbits(32)  # a new game, but still reproducible
         self.start_new_game()
 
     def shoot(self):
-        if not self.paused and not self.game_over and len(self.bullets) < 8:
-            self.bullets.append(self.player.shoot())
+        if not self.paused and not self.game_over:
+            self._shots += 1
+            self.player.shoot(self.bullet_pool)
+
+    def save_replay(self, path):
+        """Write this game's seed and recorded input; returns the file size."""
+        return self.recorder.save(path, self.seed, self.STEP_MS)
 
     def update_ui(self):
         self.canvas.itemconfig(self.score_text, text=f"Score: {self.score}")
@@ -278,9 +390,58 @@ class SpaceExplorerGame:
         self.canvas.itemconfig(self.planets_text, text=f"Planets: {self.planets_collected}")
 
     def game_loop(self):
+        steps = self.loop.run_frame()
+        if self.timer.frame % self.AUDIT_FRAMES == 0:
+            self.entities.audit()
+        row = self.timer.end_frame(steps=steps, entities=self.entity_count(), tk_calls=self.canvas.take(),
+                                   leaked_items=self.entities.leaked_items, **self.pool_stats())
+        self.update_overlay(row)
+        self.root.after(self.RENDER_MS, self.game_loop)
+
+    def tick(self, render=False):
+        """Headless frame: one step, then fire any timers that fell due."""
+        self.step()
+        if render:
+            self.render(1.0)
+        self.root.advance(self.STEP_MS)
+
+    def pool_stats(self):
+        """High-water mark and exhaustion count of both bullet pools (frame trace columns)."""
+        player, alien = self.bullet_pool.stats(), self.alien_bullet_pool.stats()
+        return {"player_pool_hw": player["high_water"], "player_pool_exhausted": player["exhausted"],
+                "alien_pool_hw": alien["high_water"], "alien_pool_exhausted": alien["exhausted"]}
+
+    def entity_count(self):
+        return len(self.aliens) + len(self.planets) + len(self.bullets) + len(self.alien_bullets) + 1
+
+    def step(self):
         if self.paused or self.game_over:
-            self.root.after(16, self.game_loop)
             return
+        self.recorder.record(self.keys, self._shots)
+        self._shots = 0
+        if isinstance(self.clock, SimClock):
+            self.clock.advance(self.STEP_MS)
+        with self.timer.phase("spawn"):
+            self.spawn_entities()
+        with self.timer.phase("update"):
+            self.update_entities()
+            self.entities.flush()
+        with self.timer.phase("collision"):
+            self.check_collisions()
+            self.entities.flush()
+
+    def spawn_entities(self):
+        rng = self.rng
+        if rng.random() < self.ALIEN_SPAWN_RATE:
+            Alien(self.alien_store, rng.randint(30, 750), -50, self.clock, rng)
+        if rng.random() < self.PLANET_SPAWN_RATE:
+            sz = rng.randint(25, 55)
+            Planet(self.planet_store, rng.randint(0, self.WIDTH-sz), -sz, sz, rng)
+
+    def update_entities(self):
+        for store in self.stores:
+            store.snapshot()
+        self.player.snapshot()
 
         # Player movement
         if "Left" in self.keys:   self.player.move_left()
@@ -288,88 +449,102 @@ class SpaceExplorerGame:
         if "Up" in self.keys:     self.player.move_up()
         if "Down" in self.keys:   self.player.move_down()
 
-        # Spawn
-        if random.random() < 0.02:
-            self.aliens.append(Alien(self.canvas, random.randint(30, 750), -50))
-        if random.random() < 0.008:
-            sz = random.randint(25, 55)
-            self.planets.append(Planet(self.canvas, random.randint(0, self.WIDTH-sz), -sz, sz))
-
         # Update bullets
-        for b in self.bullets[:]:
-            b.update()
-            if not self.canvas.coords(b._id):
-                self.bullets.remove(b)
-
-        # Update aliens
-        for a in self.aliens[:]:
-            bullet = a.update()
-            if bullet:
-                self.alien_bullets.append(bullet)
-            if a.position()[1] > self.HEIGHT + 50:
-                a.destroy()
-                self.aliens.remove(a)
+        self.bullet_store.advance()
+        for b in self.bullet_store.outside(-100, -100, 900, 700):
+            self.entities.kill(b)
+
+        # Update aliens: due shooters fire, everyone bounces off the walls and moves
+        now = self.clock()
+        for a in self.alien_store.due(now):
+            a.next_shoot = now + self.rng.uniform(2, 5)
+            a.shoot(self.alien_bullet_pool)
+        self.alien_store.bounce_x(0, 765)
+        self.alien_store.advance()
+        for a in self.alien_store.outside(-math.inf, -math.inf, math.inf, self.HEIGHT + 50):
+            self.entities.kill(a)
 
         # Update alien bullets
-        for b in self.alien_bullets[:]:
-            b.update()
-            if not self.canvas.coords(b._id):
-                self.alien_bullets.remove(b)
+        self.alien_bullet_store.advance()
+        for b in self.alien_bullet_store.outside(-100, -100, 900, 700):
+            self.entities.kill(b)
 
         # Update planets
-        for p in self.planets[:]:
-            p.update()
-            if p.collides_with(self.player):
-                p.destroy()
-                self.planets.remove(p)
-                self.planets_collected += 1
-                self.score += 10
+        self.planet_store.advance()
+        for p in self.planet_store.outside(-math.inf, -math.inf, math.inf, self.HEIGHT + 50):
+            self.entities.kill(p)
+
+    def check_collisions(self):
+        for p in self.planet_store.colliding(self.player):
+            self.entities.kill(p)
+            self.planets_collected += 1
+            self.score += 10
+            self.update_ui()
+
+            # +1 LIFE EVERY 5 PLANETS!
+            if self.planets_collected % 5 == 0:
+                self.lives += 1
                 self.update_ui()
+                self.canvas.create_text(
+                    self.WIDTH//2, 100, text="+1 LIFE!", fill="cyan",
+                    font=("Arial", 30, "bold"), tags="temp"
+                )
+                self.root.after(1500, lambda: self.canvas.delete("temp"))
 
-                # +1 LIFE EVERY 5 PLANETS!
-                if self.planets_collected % 5 == 0:
-                    self.lives += 1
-                    self.update_ui()
-                    self.canvas.create_text(
-                        self.WIDTH//2, 100, text="+1 LIFE!", fill="cyan",
-                        font=("Arial", 30, "bold"), tags="temp"
-                    )
-                    self.root.after(1500, lambda: self.canvas.delete("temp"))
-
-            elif p.position()[1] > self.HEIGHT + 50:
-                self.planets.remove(p)
-
-        # Collisions
-        for b in self.bullets[:]:
-            for a in self.aliens[:]:
-                if b.collides_with(a):
-                    b.destroy()
-                    a.destroy()
-                    self.bullets.remove(b)
-                    self.aliens.remove(a)
-                    self.score += 20
-                    self.update_ui()
-                    break
-
-        for b in self.alien_bullets[:]:
-            if b.collides_with(self.player):
-                b.destroy()
-                self.alien_bullets.remove(b)
-                self.lives -= 1
-                self.update_ui()
-                if self.lives <= 0:
-                    self.game_over_screen()
-
-        for a in self.aliens[:]:
-            if a.collides_with(self.player):
-                a.destroy()
-                self.aliens.remove(a)
-                self.lives -= 1
+        self.brute_force_pairs = len(self.bullets) * len(self.aliens)
+        if self.bullets:  # nothing to index when no player shot is in flight
+            self.alien_grid.rebuild_store(self.alien_store)
+        else:
+            self.alien_grid.clear()
+        for b in self.bullets:
+            a = self.alien_grid.first_hit(b)
+            if a:
+                self.entities.kill(b)
+                self.entities.kill(a)
+                self.alien_grid.remove(a)
+                self.score += 20
                 self.update_ui()
-                if self.lives <= 0:
-                    self.game_over_screen()
-
-        self.root.after(16, self.game_loop)
+        self.collision_pairs = self.alien_grid.pairs_tested
+
+        for b in self.alien_bullet_store.colliding(self.player):
+            self.entities.kill(b)
+            self.lives -= 1
+            self.update_ui()
+            if self.lives <= 0:
+                self.game_over_screen()
+
+        for a in self.alien_store.colliding(self.player):
+            if a._dead:  # already shot down this step
+                continue
+            self.entities.kill(a)
+            self.lives -= 1
+            self.update_ui()
+            if self.lives <= 0:
+                self.game_over_screen()
+
+    def render(self, alpha):
+        with self.timer.phase("render"):
+            for store in self.stores:
+                store.render(alpha, shared=self.batched_render)
+            self.player.render()
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if not self.show_overlay and self.overlay_id:
+            self.canvas.delete(self.overlay_id)
+            self.overlay_id = None
+
+    def update_overlay(self, row):
+        if not self.show_overlay or row["frame"] % 10:
+            return
+        text = (f"FPS {row['fps']:.0f} | tick {row['tick_ms']:.2f} ms | render {row['render_ms']:.2f} ms"
+                f" | entities {row['entities']} | tk calls {row['tk_calls']} | leaked {row['leaked_items']}")
+        if self.overlay_id is None:
+            self.overlay_id = self.canvas.create_text(
+                self.WIDTH//2, self.HEIGHT - 15, text=text, fill="lime", font=("Courier", 11)
+            )
+        else:
+            self.canvas.itemconfig(self.overlay_id, text=text)
 
     def game_over_screen(self):
         self.game_over = True
@@ -380,8 +555,31 @@ class SpaceExplorerGame:
                                 fill="white", font=("Arial", 24))
 
 
+def play_replay(path, render=False):
+    """
+    Re-run a recorded game headless, as fast as possible. Returns the game
+    (final score, timer rows...) and the wall-clock seconds it took, so the
+    same recording can be timed against different versions of the code.
+    """
+    replay = Replay(path)
+    game = SpaceExplorerGame(seed=replay.seed)
+    start = time.perf_counter()
+    for value in replay.inputs():
+        game.keys, shots = decode_input(value)
+        for _ in range(shots):
+            game.shoot()
+        game.tick(render)
+    return game, time.perf_counter() - start
+
+
 # ========== RUN ==========
 if __name__ == "__main__":
-    root = tk.Tk()
-    game = SpaceExplorerGame(root)
-    root.mainloop()
\ No newline at end of file
+    if len(sys.argv) == 3 and sys.argv[1] == "--replay":
+        game, elapsed = play_replay(sys.argv[2])
+        steps = len(game.recorder)
+        print(f"{steps} steps in {elapsed:.2f} s ({elapsed / max(steps, 1) * 1000:.3f} ms/step), "
+              f"score {game.score}, lives {game.lives}")
+    else:
+        root = tk.Tk()
+        game = SpaceExplorerGame(root)
+        root.mainloop()
\ No newline at end of file
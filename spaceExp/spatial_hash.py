@@ -0,0 +1,86 @@
+"""
+Uniform-grid spatial hash used as the collision broad-phase for both
+space-game versions. Works with any GameObject (uses _x, _y, _size).
+"""
+
+
+class SpatialHash:
+    """
+    Buckets objects into square cells by their bounding box.
+
+    Rebuild it once per tick with the objects that can be hit (aliens), then
+    ask for the first hit of each moving object (bullets): only objects that
+    share a cell are handed to collides_with(). pairs_tested counts those
+    narrow-phase checks so they can be compared with the all-pairs count.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}
+        self.pairs_tested = 0
+
+    def _cells_for(self, obj):
+        cs = self.cell_size
+        x0, y0 = int(obj._x // cs), int(obj._y // cs)
+        x1, y1 = int((obj._x + obj._size) // cs), int((obj._y + obj._size) // cs)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def clear(self):
+        self._cells.clear()
+        self.pairs_tested = 0
+
+    def insert(self, obj):
+        for cell in self._cells_for(obj):
+            self._cells.setdefault(cell, []).append(obj)
+
+    def remove(self, obj):
+        for cell in self._cells_for(obj):
+            bucket = self._cells.get(cell)
+            if bucket and obj in bucket:
+                bucket.remove(obj)
+
+    def rebuild(self, objects):
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def rebuild_store(self, store):
+        """rebuild() for an EntityStore: cell ranges come from its arrays in one pass."""
+        self.clear()
+        n = store.n
+        if not n:
+            return
+        cs = self.cell_size
+        x, y, size = store.x[:n], store.y[:n], store.size[:n]
+        x0, y0 = (x // cs).astype(int).tolist(), (y // cs).astype(int).tolist()
+        x1, y1 = ((x + size) // cs).astype(int).tolist(), ((y + size) // cs).astype(int).tolist()
+        cells = self._cells
+        for obj, ax, ay, bx, by in zip(store.objects, x0, y0, x1, y1):
+            for cx in range(ax, bx + 1):
+                for cy in range(ay, by + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [obj]
+                    else:
+                        bucket.append(obj)
+
+    def candidates(self, obj):
+        """Objects sharing at least one cell with obj (each reported once)."""
+        found = []
+        seen = set()
+        for cell in self._cells_for(obj):
+            for other in self._cells.get(cell, ()):
+                if id(other) not in seen:
+                    seen.add(id(other))
+                    found.append(other)
+        return found
+
+    def first_hit(self, obj):
+        """Return the first indexed object colliding with obj, or None."""
+        for other in self.candidates(obj):
+            self.pairs_tested += 1
+            if obj.collides_with(other):
+                return other
+        return None
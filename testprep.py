@@ -1,11 +1,15 @@
-from datetime import date
+import heapq
+from datetime import date, timedelta
 
 class BorrowRecord:
-    def __init__(self, title, borrowerName, dateBorrowed, status):
+    def __init__(self, title, borrowerName, dateBorrowed, status, dueDate=None):
         self._set_title(title)              
         self._borrowerName = borrowerName
         self._dateBorrowed = dateBorrowed
         self._status = status
+        # default loan period is 14 days
+        self._dueDate = dueDate or (date.fromisoformat(dateBorrowed) + timedelta(days=14)).isoformat()
+        self._library = None  # set by Library.add_record so returns update its overdue count
     
     # title Validation
     def _set_title(self, title):
@@ -22,23 +26,56 @@ class BorrowRecord:
         return self._dateBorrowed
     def get_status(self):
         return self._status
+    def get_dueDate(self):
+        return self._dueDate
+
+    # ISO dates compare correctly as strings
+    def is_overdue(self, today=None):
+        today = today or date.today().isoformat()
+        return self._status != "Returned" and today > self._dueDate
     
     # Mark as returned
     def marked_returned(self):
         self._status = "Returned"
+        if self._library:
+            self._library._record_returned(self)
 
 class Library:
     def __init__(self):
         self._records = [] 
+        self._dueHeap = []      # (dueDate, seq, record) for loans not yet overdue
+        self._overdue = set()   # loans found overdue and not yet returned
+        self._seq = 0
 
     def add_record(self, record):
         self._records.append(record)
+        record._library = self
+        if record.get_status() != "Returned":
+            self._seq += 1
+            heapq.heappush(self._dueHeap, (record.get_dueDate(), self._seq, record))
+
+    # pop loans whose due date has passed; returned ones are just dropped
+    def check_overdue(self, today=None):
+        today = today or date.today().isoformat()
+        while self._dueHeap and self._dueHeap[0][0] < today:
+            record = heapq.heappop(self._dueHeap)[2]
+            if record.get_status() != "Returned":
+                self._overdue.add(record)
+
+    def _record_returned(self, record):
+        self._overdue.discard(record)
 
     # print summary 
     def print_summary(self):
         today = date.today().isoformat()
         today_count = sum(1 for r in self._records if r.get_dateBorrowed() == today)
         print(f"Total books borrowed today: {today_count}")
+        print(f"Overdue books: {self.overdue_count()}")
+
+    # today only moves forward, so each loan is popped from the heap once
+    def overdue_count(self, today=None):
+        self.check_overdue(today)
+        return len(self._overdue)
 
 library = Library()
 